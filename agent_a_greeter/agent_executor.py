@@ -1,25 +1,29 @@
 """Agent executor for the Greeter Agent."""
 
-import json
 import logging
-import traceback
 import uuid
 from typing import Any, AsyncIterable
 
+import orjson
 from a2a.server.agent_executor import A2AAgentExecutor, InternalError
 from a2a.server.responses import StreamingMessage
 from a2a.types import Request
 
-from greeter_agent import GreeterAgent
-
 logger = logging.getLogger(__name__)
 
+# Progress text used when an agent event carries no update of its own
+DEFAULT_PROGRESS_MESSAGE = "Processing..."
+
 
 class GreeterAgentExecutor(A2AAgentExecutor):
     """Executor for the Greeter Agent."""
 
     def __init__(self):
         super().__init__()
+        # Imported here so that importing this module does not load the ADK
+        # stack; the cost is paid when the executor is built
+        from greeter_agent import GreeterAgent
+
         self._agent = GreeterAgent()
 
     async def execute(self, request: Request) -> AsyncIterable[StreamingMessage]:
@@ -31,20 +35,24 @@ class GreeterAgentExecutor(A2AAgentExecutor):
         Yields:
             StreamingMessage: Messages from the agent execution.
         """
-        logger.info(f"Executing GreeterAgent with request: {request}")
+        logger.info("Executing GreeterAgent with request: %s", request)
         
         try:
             # Extract query from request
-            if hasattr(request, 'messages') and request.messages:
-                query = request.messages[-1].content
-            elif hasattr(request, 'query'):
-                query = request.query
+            messages = getattr(request, 'messages', None)
+            if messages:
+                query = messages[-1].content
             else:
-                query = str(request)
+                query = getattr(request, 'query', None)
+                if query is None:
+                    query = str(request)
             
             # Generate session ID
-            session_id = str(uuid.uuid4())
-            
+            session_id = uuid.uuid4().hex
+
+            # Last progress text sent, so repeated updates are only sent once
+            last_update = None
+
             # Stream responses from agent
             async for event in self._agent.stream(query, session_id):
                 if event.get("is_task_complete"):
@@ -52,32 +60,27 @@ class GreeterAgentExecutor(A2AAgentExecutor):
                     
                     # Handle different content types
                     if isinstance(content, str):
-                        # Check if it's a JSON string (form response)
-                        try:
-                            parsed = json.loads(content)
-                            if parsed.get("type") == "form":
+                        # Check if it's a JSON string (form response). Plain
+                        # text and other JSON are both sent as tasks, so only
+                        # parse strings that could be a form object.
+                        message_type = "task"
+                        if content.lstrip().startswith("{") and '"form"' in content:
+                            try:
+                                parsed = orjson.loads(content)
+                            except orjson.JSONDecodeError:
+                                parsed = None
+                            if isinstance(parsed, dict) and parsed.get("type") == "form":
                                 # This is a form response
-                                yield StreamingMessage(
-                                    type="form",
-                                    content=content,
-                                )
-                            else:
-                                # Regular JSON response
-                                yield StreamingMessage(
-                                    type="task",
-                                    content=content,
-                                )
-                        except json.JSONDecodeError:
-                            # Plain text response
-                            yield StreamingMessage(
-                                type="task",
-                                content=content,
-                            )
+                                message_type = "form"
+                        yield StreamingMessage(
+                            type=message_type,
+                            content=content,
+                        )
                     elif isinstance(content, dict):
                         # Direct dict response
                         yield StreamingMessage(
                             type="task",
-                            content=json.dumps(content),
+                            content=orjson.dumps(content).decode(),
                         )
                     else:
                         yield StreamingMessage(
@@ -85,13 +88,36 @@ class GreeterAgentExecutor(A2AAgentExecutor):
                             content=str(content),
                         )
                 else:
-                    # Progress update
+                    # Progress update, skipped if identical to the previous one
+                    update = event.get("updates", DEFAULT_PROGRESS_MESSAGE)
+                    if update == last_update:
+                        continue
+                    last_update = update
                     yield StreamingMessage(
                         type="progress",
-                        content=event.get("updates", "Processing..."),
+                        content=update,
                     )
                     
         except Exception as e:
-            logger.error(f"Error in GreeterAgentExecutor: {str(e)}")
-            logger.error(traceback.format_exc())
-            raise InternalError(f"Agent execution failed: {str(e)}")
\ No newline at end of file
+            logger.exception("Error in GreeterAgentExecutor: %s", e)
+            raise InternalError(f"Agent execution failed: {str(e)}")
+
+
+class StartingAgentExecutor(A2AAgentExecutor):
+    """Placeholder executor used while the Greeter Agent is still loading.
+
+    The app answers A2A requests with a 503 until the real executor is
+    installed, so this is only a fallback in case a request reaches it.
+    """
+
+    async def execute(self, request: Request) -> AsyncIterable[StreamingMessage]:
+        """Reject the request until the real executor has been installed.
+
+        Args:
+            request: The incoming request.
+
+        Raises:
+            InternalError: Always, as the Greeter Agent is not ready yet.
+        """
+        raise InternalError("Greeter Agent is still starting up, please retry.")
+        yield  # Makes this an async generator like GreeterAgentExecutor.execute
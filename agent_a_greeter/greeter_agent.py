@@ -1,8 +1,11 @@
-import json
-import random
-from typing import Any, AsyncIterable, Optional
+import secrets
+from collections import OrderedDict
+from typing import Any, AsyncIterable, Callable, Optional, Union
+
+import orjson
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
@@ -10,9 +13,47 @@ from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
 
-# Local cache of greeting IDs for state management
-greeting_ids = set()
-greeting_history = {}
+# Local cache of greeting form data keyed by greeting ID, for state management.
+# Bounded so a long-running server does not accumulate every form it created;
+# the least recently used entries are evicted first.
+MAX_GREETING_HISTORY = 10_000
+greeting_history: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+# JSON schema of the greeting customization form; identical for every form
+GREETING_FORM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "Name of the person to greet",
+            "title": "Name",
+        },
+        "style": {
+            "type": "string",
+            "enum": ["formal", "casual", "fun"],
+            "description": "Style of greeting",
+            "title": "Greeting Style",
+        },
+        "message": {
+            "type": "string",
+            "description": "Optional custom message to include",
+            "title": "Custom Message",
+        },
+        "greeting_id": {
+            "type": "string",
+            "description": "Greeting ID for tracking",
+            "title": "Greeting ID",
+        },
+    },
+    "required": ["name", "style", "greeting_id"],
+}
+
+# Greeting text per style, formatted with the person's name
+GREETING_TEMPLATES = {
+    "formal": "Good day, {name}. I hope this message finds you well.",
+    "fun": "Hey there, {name}! 🎉 Hope you're having an awesome day!",
+    "casual": "Hello {name}! This is Agent A (Greeter) responding. I hope you're having a wonderful day!",
+}
 
 
 def create_greeting_form(
@@ -31,8 +72,7 @@ def create_greeting_form(
     Returns:
         dict[str, Any]: A dictionary containing the greeting form data.
     """
-    greeting_id = "greeting_" + str(random.randint(1000000, 9999999))
-    greeting_ids.add(greeting_id)
+    greeting_id = "greeting_" + secrets.token_hex(4)
     
     form_data = {
         "greeting_id": greeting_id,
@@ -41,8 +81,10 @@ def create_greeting_form(
         "message": "<optional custom message>" if not message else message,
     }
     
-    # Store in history
+    # Store in history, evicting the least recently used form when full
     greeting_history[greeting_id] = form_data
+    if len(greeting_history) > MAX_GREETING_HISTORY:
+        greeting_history.popitem(last=False)
     
     return form_data
 
@@ -56,7 +98,8 @@ def return_greeting_form(
     Returns a structured JSON object for greeting customization.
     
     Args:
-        form_request (dict[str, Any]): The greeting form data.
+        form_request (dict[str, Any]): The greeting form data. A JSON string
+            is also accepted and decoded; pass a dict to skip that step.
         tool_context (ToolContext): The context in which the tool operates.
         instructions (str): Instructions for the form.
         
@@ -64,103 +107,156 @@ def return_greeting_form(
         dict[str, Any]: A JSON dictionary for the form response.
     """
     if isinstance(form_request, str):
-        form_request = json.loads(form_request)
+        form_request = orjson.loads(form_request)
     
     tool_context.actions.skip_summarization = True
     tool_context.actions.escalate = True
     
     form_dict = {
         "type": "form",
-        "form": {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "Name of the person to greet",
-                    "title": "Name",
-                },
-                "style": {
-                    "type": "string",
-                    "enum": ["formal", "casual", "fun"],
-                    "description": "Style of greeting",
-                    "title": "Greeting Style",
-                },
-                "message": {
-                    "type": "string",
-                    "description": "Optional custom message to include",
-                    "title": "Custom Message",
-                },
-                "greeting_id": {
-                    "type": "string",
-                    "description": "Greeting ID for tracking",
-                    "title": "Greeting ID",
-                },
-            },
-            "required": ["name", "style", "greeting_id"],
-        },
+        "form": GREETING_FORM_SCHEMA,
         "form_data": form_request,
         "instructions": instructions or "Please customize your greeting preferences",
     }
-    return json.dumps(form_dict)
+    return orjson.dumps(form_dict).decode()
+
+
+def _format_greeting(name: str, style: str, message: str = "") -> str:
+    """Format the greeting text for a style; unknown styles fall back to casual."""
+    template = GREETING_TEMPLATES.get(style, GREETING_TEMPLATES["casual"])
+    greeting = template.format(name=name)
+    
+    if message:
+        greeting += f" {message}"
+    
+    return greeting
 
 
 def generate_greeting(greeting_id: str) -> dict[str, Any]:
     """Generate the actual greeting based on the form data."""
-    if greeting_id not in greeting_ids:
+    # Get the greeting data
+    data = greeting_history.get(greeting_id)
+    if data is None:
         return {
             "greeting_id": greeting_id,
             "status": "Error: Invalid greeting_id.",
         }
+    greeting_history.move_to_end(greeting_id)
     
-    # Get the greeting data
-    data = greeting_history.get(greeting_id, {})
     name = data.get("name", "Friend")
     style = data.get("style", "casual")
     message = data.get("message", "")
     
-    # Generate greeting based on style
-    if style == "formal":
-        greeting = f"Good day, {name}. I hope this message finds you well."
-    elif style == "fun":
-        greeting = f"Hey there, {name}! 🎉 Hope you're having an awesome day!"
-    else:  # casual
-        greeting = f"Hello {name}! This is Agent A (Greeter) responding. I hope you're having a wonderful day!"
-    
-    if message:
-        greeting += f" {message}"
-    
     return {
         "greeting_id": greeting_id,
         "status": "delivered",
-        "greeting": greeting,
+        "greeting": _format_greeting(name, style, message),
         "style": style,
     }
 
 
+def greet_simple(
+    name: Optional[str] = None,
+    style: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Create and deliver a greeting in one step, without a customization form.
+
+    Args:
+        name (str): The name to greet. Defaults to "Friend".
+        style (str): The greeting style (formal/casual/fun). Defaults to casual.
+
+    Returns:
+        dict[str, Any]: The delivered greeting and its style. No form is
+            created, so nothing is stored in greeting_history.
+    """
+    style = style or "casual"
+    return {
+        "status": "delivered",
+        "greeting": _format_greeting(name or "Friend", style),
+        "style": style,
+    }
+
+
+def _assemble_final_response(event: Event) -> Union[str, dict[str, Any]]:
+    """Build the task content for a final response event.
+
+    Text parts are joined with newlines. When the event also carries a
+    function response, the first one is returned alongside the text.
+
+    Args:
+        event: The final response event emitted by the runner.
+
+    Returns:
+        The joined text, the first function response's data, a dict with
+        both, or an empty string if the event has no content.
+    """
+    if not (event.content and event.content.parts):
+        return ""
+
+    # Handle mixed responses (text + function calls) in one pass; only the
+    # first function response is ever used
+    text_parts = []
+    function_response = None
+    for p in event.content.parts:
+        if p.text:
+            text_parts.append(p.text)
+        elif p.function_response and function_response is None:
+            function_response = p.function_response
+    function_data = function_response.model_dump() if function_response else None
+
+    if text_parts and function_data:
+        # Mixed response: combine text and function data
+        return {
+            "text": "\n".join(text_parts),
+            "function_data": function_data,
+        }
+    if text_parts:
+        # Text only response
+        return "\n".join(text_parts)
+    if function_data:
+        # Function only response
+        return function_data
+    return ""
+
+
+# Runners keyed by agent name, shared by every GreeterAgent in the process so
+# they all use the same in-memory session, artifact and memory services
+_runners: dict[str, Runner] = {}
+
+
+def _get_runner(name: str, build_agent: Callable[[], LlmAgent]) -> Runner:
+    """Return the shared Runner for ``name``, building its agent on first use."""
+    runner = _runners.get(name)
+    if runner is None:
+        agent = build_agent()
+        runner = _runners[name] = Runner(
+            app_name=agent.name,
+            agent=agent,
+            artifact_service=InMemoryArtifactService(),
+            session_service=InMemorySessionService(),
+            memory_service=InMemoryMemoryService(),
+        )
+    return runner
+
+
 class GreeterAgent:
     """An agent that provides customizable greetings using Gemini."""
     
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
+    PROCESSING_MESSAGE = "Processing your greeting request..."
+    AGENT_NAME = "greeter_agent"
     
     def __init__(self):
-        self._agent = self._build_agent()
         self._user_id = "greeter_agent_user"
-        self._runner = Runner(
-            app_name=self._agent.name,
-            agent=self._agent,
-            artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
-            memory_service=InMemoryMemoryService(),
-        )
-    
-    def get_processing_message(self) -> str:
-        return "Processing your greeting request..."
+        self._runner = _get_runner(self.AGENT_NAME, self._build_agent)
+        self._agent = self._runner.agent
     
     def _build_agent(self) -> LlmAgent:
         """Builds the LLM agent for the Greeter agent using Gemini."""
         return LlmAgent(
             model="gemini-2.0-flash-001",  # Using Gemini like the sample
-            name="greeter_agent",
+            name=self.AGENT_NAME,
             description=(
                 "This agent provides customizable greetings. "
                 "It demonstrates A2A communication with form handling and state management."
@@ -170,9 +266,8 @@ You are a friendly greeting agent. Your job is to help users create personalized
 
 When someone asks you to greet a person, you have two options:
 
-1. For simple greetings (e.g., "greet John"), use the tools to:
-   - First create a greeting form with `create_greeting_form()` 
-   - Then immediately generate the greeting with `generate_greeting()`
+1. For simple greetings (e.g., "greet John"):
+   - Call `greet_simple()` once with the name and style
    - Return the greeting text to the user
 
 2. For custom greetings (when user says "custom" or "customize"), use the tools to:
@@ -187,11 +282,12 @@ Instructions:
 - If no name is provided, you can use "Friend" as a default
 
 Examples:
-- "Please greet John" -> create_greeting_form(name="John", style="casual") then generate_greeting()
+- "Please greet John" -> greet_simple(name="John", style="casual")
 - "Custom greeting for Maria" -> create_greeting_form(name="Maria") then return_greeting_form()
-- "Say hello formally to Dr. Smith" -> create_greeting_form(name="Dr. Smith", style="formal") then generate_greeting()
+- "Say hello formally to Dr. Smith" -> greet_simple(name="Dr. Smith", style="formal")
 """,
             tools=[
+                greet_simple,
                 create_greeting_form,
                 return_greeting_form,
                 generate_greeting,
@@ -216,39 +312,12 @@ Examples:
             user_id=self._user_id, session_id=session.id, new_message=content
         ):
             if event.is_final_response():
-                response = ""
-                if event.content and event.content.parts:
-                    # Handle mixed responses (text + function calls)
-                    text_parts = [p.text for p in event.content.parts if p.text]
-                    function_parts = [
-                        p.function_response.model_dump()
-                        for p in event.content.parts
-                        if p.function_response
-                    ]
-                    
-                    if text_parts and function_parts:
-                        # Mixed response: combine text and function data
-                        response = {
-                            "text": "\n".join(text_parts),
-                            "function_data": (
-                                function_parts[0] if function_parts else None
-                            ),
-                        }
-                    elif text_parts:
-                        # Text only response
-                        response = "\n".join(text_parts)
-                    elif function_parts:
-                        # Function only response
-                        response = function_parts[0]
-                    else:
-                        response = ""
-                
                 yield {
                     "is_task_complete": True,
-                    "content": response,
+                    "content": _assemble_final_response(event),
                 }
             else:
                 yield {
                     "is_task_complete": False,
-                    "updates": self.get_processing_message(),
+                    "updates": self.PROCESSING_MESSAGE,
                 }
\ No newline at end of file
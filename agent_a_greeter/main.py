@@ -1,6 +1,12 @@
+import asyncio
+import contextlib
+import hashlib
 import logging
 import os
+import signal
+from typing import AsyncIterator, Optional
 
+import orjson
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
@@ -9,12 +15,14 @@ from a2a.types import (
     AgentCard,
     AgentSkill,
 )
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from greeter_agent import GreeterAgent
-from agent_executor import GreeterAgentExecutor
+from agent_executor import GreeterAgentExecutor, StartingAgentExecutor
 from dotenv import load_dotenv
 
 
@@ -32,6 +40,27 @@ class MissingAPIKeyError(Exception):
 secrets_health = {
     "GOOGLE_API_KEY": "OK" if os.getenv("GOOGLE_API_KEY") is not None else "MISSING",
 }
+# Health data only depends on the environment and the executor load state,
+# so each possible body is serialized once
+_health_body = orjson.dumps(
+    {"status": "Greeter Agent is running.", "secrets_health": secrets_health}
+)
+_unavailable_bodies = {
+    "loading": orjson.dumps(
+        {"status": "Greeter Agent is starting.", "secrets_health": secrets_health}
+    ),
+    "failed": orjson.dumps(
+        {"status": "Greeter Agent failed to start.", "secrets_health": secrets_health}
+    ),
+}
+
+# Load state of the Greeter executor: "loading" until _load_executor
+# finishes, then "ready" or "failed"
+_executor_state = "loading"
+
+# Same as GreeterAgent.SUPPORTED_CONTENT_TYPES; repeated here so building the
+# agent card does not import the ADK stack
+SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
 capabilities = AgentCapabilities(streaming=True)
 skill = AgentSkill(
@@ -53,13 +82,23 @@ agent_card = AgentCard(
     ),
     url=os.getenv("HU_APP_URL"),
     version="1.0.0",
-    defaultInputModes=GreeterAgent.SUPPORTED_CONTENT_TYPES,
-    defaultOutputModes=GreeterAgent.SUPPORTED_CONTENT_TYPES,
+    defaultInputModes=SUPPORTED_CONTENT_TYPES,
+    defaultOutputModes=SUPPORTED_CONTENT_TYPES,
     capabilities=capabilities,
     skills=[skill],
 )
+AGENT_CARD_PATH = "/.well-known/agent.json"
+
+# The agent card is fixed for the life of the process, so serialize it once
+_agent_card_body = agent_card.model_dump_json(by_alias=True, exclude_none=True).encode()
+_agent_card_headers = {
+    "ETag": f'"{hashlib.blake2b(_agent_card_body, digest_size=8).hexdigest()}"',
+    "Cache-Control": "public, max-age=300",
+}
+# The real executor is swapped in by _load_executor once the server is up;
+# until then _ReadinessGateMiddleware answers A2A requests with a 503
 request_handler = DefaultRequestHandler(
-    agent_executor=GreeterAgentExecutor(),
+    agent_executor=StartingAgentExecutor(),
     task_store=InMemoryTaskStore(),
 )
 
@@ -70,29 +109,158 @@ server = A2AStarletteApplication(
 )
 
 
-async def _health(request: Request) -> JSONResponse:
+def _unavailable_response() -> Response:
+    """Builds the 503 response sent while the Greeter executor is not ready."""
+    return Response(
+        _unavailable_bodies[_executor_state],
+        status_code=503,
+        media_type="application/json",
+        headers={"Retry-After": "5"},
+    )
+
+
+async def _health(request: Request) -> Response:
     """Handles GET requests for the health endpoint.
 
     Args:
         request: The incoming Starlette Request object.
 
     Returns:
-        A JSONResponse containing the application health data.
+        A Response containing the pre-serialized application health data, or
+        a 503 while the Greeter executor is loading or after it failed to load.
     """
-    return JSONResponse(
-        {"status": "Greeter Agent is running.", "secrets_health": secrets_health}
+    if _executor_state != "ready":
+        return _unavailable_response()
+    return Response(_health_body, media_type="application/json")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Checks an If-None-Match header against the current ETag.
+
+    The header may list several entity tags separated by commas, each
+    optionally weak (``W/`` prefix), or be ``*`` to match any version.
+
+    Args:
+        if_none_match: The raw If-None-Match header value, if any.
+        etag: The current strong ETag, including its quotes.
+
+    Returns:
+        True if the client already holds the current version.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def _agent_card(request: Request) -> Response:
+    """Handles GET requests for the agent card.
+
+    Args:
+        request: The incoming Starlette Request object.
+
+    Returns:
+        A Response with the pre-serialized agent card, or an empty 304 if the
+        client already holds the current version.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if _etag_matches(if_none_match, _agent_card_headers["ETag"]):
+        return Response(status_code=304, headers=_agent_card_headers)
+    return Response(
+        _agent_card_body, media_type="application/json", headers=_agent_card_headers
     )
 
 
+class _ReadinessGateMiddleware:
+    """Answers A2A requests with a 503 until the Greeter executor is ready.
+
+    The health endpoint and the agent card stay available so the platform
+    and other agents can see the app is still starting.
+    """
+
+    _ALWAYS_AVAILABLE_PATHS = frozenset({"/health", AGENT_CARD_PATH})
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and _executor_state != "ready"
+            and scope["path"] not in self._ALWAYS_AVAILABLE_PATHS
+        ):
+            await _unavailable_response()(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+async def _load_executor() -> None:
+    """Builds the Greeter executor in a worker thread and installs it.
+
+    Building it imports the ADK and Gemini stack, which is slow; doing it off
+    the event loop lets the server answer probes in the meantime. If it
+    fails, the server is shut down so the platform restarts the instance
+    instead of it serving 503s forever.
+    """
+    global _executor_state
+    try:
+        request_handler.agent_executor = await asyncio.to_thread(
+            GreeterAgentExecutor
+        )
+    except Exception:
+        _executor_state = "failed"
+        logger.exception("Failed to load the Greeter Agent executor, shutting down")
+        signal.raise_signal(signal.SIGTERM)
+        return
+    _executor_state = "ready"
+    logger.info("Greeter Agent executor is ready.")
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(app: Starlette) -> AsyncIterator[None]:
+    """Configures the running event loop for the lifetime of the app.
+
+    On Python 3.12+ tasks are created with ``asyncio.eager_task_factory`` so
+    coroutines that finish without awaiting skip a trip through the event
+    loop. Older interpreters keep the default task factory.
+
+    The Greeter executor is then loaded in the background; until it is ready,
+    ``/health`` and A2A requests get a 503.
+
+    Args:
+        app: The Starlette application being served.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    # Keep a reference so the task is not garbage collected while running
+    executor_loader = asyncio.create_task(_load_executor())
+    yield
+    executor_loader.cancel()
+
+
 app = server.build(
+    agent_card_url=AGENT_CARD_PATH,
     routes=[
+        # Registered ahead of the A2A routes so it replaces the default handler
+        Route(
+            AGENT_CARD_PATH,
+            _agent_card,
+            methods=["GET"],
+            name="agent_card",
+        ),
         Route(
             "/health",
             _health,
             methods=["GET"],
             name="health_check",
         )
-    ]
+    ],
+    middleware=[Middleware(_ReadinessGateMiddleware)],
+    lifespan=_lifespan,
 )
 
 if __name__ == "__main__":
@@ -22,6 +22,10 @@ class CallerAgentExecutor(A2AAgentExecutor):
         super().__init__()
         self._agent = CallerAgent()
 
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the Greeter Agent ahead of requests."""
+        await self._agent.warm_up_connection()
+
     async def execute(self, request: Request) -> AsyncIterable[StreamingMessage]:
         """Execute the agent with the given request.
 
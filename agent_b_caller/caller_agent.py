@@ -1,10 +1,39 @@
-import json
 import os
 import re
 import httpx
+import orjson
 from typing import Any, AsyncIterable
 
 
+# Patterns like "call greeter for NAME" or "get greeting for NAME", merged
+# into one alternation so the query is scanned once. Exactly one group
+# captures the name. Both regexes are matched against the lowercased query,
+# so no case-insensitive flag is needed.
+_NAME_RE = re.compile(
+    r"for\s+(\w+)"
+    r"|greet\s+(\w+)"
+    r"|greeting\s+for\s+(\w+)"
+    r"|hello\s+to\s+(\w+)"
+)
+
+# Last word after "call"; only tried when none of the patterns above match,
+# as it would otherwise take the query's final word over a named person
+_CALL_LAST_WORD_RE = re.compile(r"call.*?(\w+)$")
+
+# Capitalized words that refer to the agents rather than a person's name
+_NAME_STOPWORDS = frozenset({"agent", "greeter", "caller"})
+
+# Shared client so calls to Agent A reuse pooled keep-alive connections
+# instead of opening a new one per request. HTTP/2 is only negotiated over
+# https; a plain-http AGENT_A_URL uses HTTP/1.1. Closed by the app's lifespan
+# on shutdown.
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    timeout=30.0,
+)
+
+
 class CallerAgent:
     """A simple agent that demonstrates A2A communication without LLM dependencies."""
     
@@ -12,6 +41,40 @@ class CallerAgent:
     
     def __init__(self):
         self.name = "caller_agent"
+        self.refresh_env()
+    
+    def refresh_env(self) -> None:
+        """Resolve Agent A's endpoint and request headers from the environment.
+
+        Called once on construction, after the app has loaded its .env file,
+        so requests do not repeat the lookups. Call again if the environment
+        changes.
+        """
+        agent_a_url = os.getenv("AGENT_A_URL")
+        self._process_url = f"{agent_a_url}/process" if agent_a_url else None
+        self._health_url = f"{agent_a_url}/health" if agent_a_url else None
+        
+        self._headers = {
+            "Content-Type": "application/json",
+        }
+        
+        # Add Clerk token if available
+        clerk_token = os.getenv("CLERK_TOKEN")
+        if clerk_token:
+            self._headers["Authorization"] = f"Bearer {clerk_token}"
+    
+    async def warm_up_connection(self) -> None:
+        """Open a pooled connection to Agent A before the first real call.
+
+        Best effort: any failure, including a malformed AGENT_A_URL, is
+        ignored and the first call to Agent A connects on its own.
+        """
+        if not self._health_url:
+            return
+        try:
+            await http_client.get(self._health_url, timeout=2.0)
+        except Exception:
+            pass
     
     def get_processing_message(self) -> str:
         return "Calling the Greeter Agent..."
@@ -19,140 +82,121 @@ class CallerAgent:
     def extract_name(self, query: str) -> str:
         """Extract a name from the query for the greeter."""
         # Try patterns like "call greeter for NAME" or "get greeting for NAME"
-        patterns = [
-            r"for\s+(\w+)",
-            r"greet\s+(\w+)",
-            r"greeting\s+for\s+(\w+)",
-            r"hello\s+to\s+(\w+)",
-            r"call.*?(\w+)$",  # Last word after "call"
-        ]
-        
         query_lower = query.lower()
-        for pattern in patterns:
-            match = re.search(pattern, query_lower, re.IGNORECASE)
-            if match:
-                return match.group(1).capitalize()
+        match = _NAME_RE.search(query_lower)
+        if match:
+            return match.group(match.lastindex).capitalize()
+        
+        match = _CALL_LAST_WORD_RE.search(query_lower)
+        if match:
+            return match.group(1).capitalize()
         
         # Try to find any capitalized word
         words = query.split()
         for word in words:
-            if word[0].isupper() and len(word) > 1 and word.lower() not in ['agent', 'greeter', 'caller']:
+            if word[0].isupper() and len(word) > 1 and word.lower() not in _NAME_STOPWORDS:
                 return word
         
         return "Someone"  # Default if no name found
     
     async def call_greeter_agent(self, name: str) -> str:
         """Call Agent A (Greeter Agent) to get a greeting."""
-        agent_a_url = os.getenv("AGENT_A_URL")
-        if not agent_a_url:
+        if not self._process_url:
             return "Error: AGENT_A_URL is not configured. Cannot call Agent A."
         
-        headers = {
-            "Content-Type": "application/json",
-        }
-        
-        # Add Clerk token if available
-        clerk_token = os.getenv("CLERK_TOKEN")
-        if clerk_token:
-            headers["Authorization"] = f"Bearer {clerk_token}"
-        
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Prepare the request to Agent A
-                request_data = {
-                    "query": f"Please greet {name}",
-                    "session_id": "test-session",
-                }
-                
-                # Call Agent A's process endpoint
-                response = await client.post(
-                    f"{agent_a_url}/process",
-                    json=request_data,
-                    headers=headers,
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    # Extract the actual greeting from the response
-                    if isinstance(result, dict):
-                        # Check if it's a form response
-                        if result.get("type") == "form":
-                            return f"Agent A sent a form for customization:\n{json.dumps(result, indent=2)}"
-                        elif "greeting" in result:
-                            # Enhanced greeting response
-                            greeting = result.get("greeting")
-                            status = result.get("status", "unknown")
-                            greeting_id = result.get("greeting_id", "unknown")
-                            return f"Agent A responded (ID: {greeting_id}, Status: {status}):\n{greeting}"
-                        elif "content" in result:
-                            return f"Agent A responded: {result['content']}"
-                        elif "response" in result:
-                            return f"Agent A responded: {result['response']}"
-                        else:
-                            return f"Agent A responded with: {json.dumps(result, indent=2)}"
+            # Prepare the request to Agent A
+            request_data = {
+                "query": f"Please greet {name}",
+                "session_id": "test-session",
+            }
+            
+            # Call Agent A's process endpoint
+            response = await http_client.post(
+                self._process_url,
+                content=orjson.dumps(request_data),
+                headers=self._headers,
+            )
+            
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                # Extract the actual greeting from the response
+                if isinstance(result, dict):
+                    # Check if it's a form response
+                    if result.get("type") == "form":
+                        return f"Agent A sent a form for customization:\n{response.text}"
+                    elif "greeting" in result:
+                        # Enhanced greeting response
+                        greeting = result.get("greeting")
+                        status = result.get("status", "unknown")
+                        greeting_id = result.get("greeting_id", "unknown")
+                        return f"Agent A responded (ID: {greeting_id}, Status: {status}):\n{greeting}"
+                    elif "content" in result:
+                        return f"Agent A responded: {result['content']}"
+                    elif "response" in result:
+                        return f"Agent A responded: {result['response']}"
                     else:
-                        return f"Agent A responded: {result}"
+                        return f"Agent A responded with: {response.text}"
                 else:
-                    return f"Error calling Agent A: HTTP {response.status_code} - {response.text}"
-                    
+                    return f"Agent A responded: {result}"
+            else:
+                return f"Error calling Agent A: HTTP {response.status_code} - {response.text}"
+                
         except httpx.TimeoutException:
             return "Error: Timeout while calling Agent A. The agent might be unavailable."
         except Exception as e:
             return f"Error calling Agent A: {str(e)}"
     
     async def stream(self, query: str, session_id: str) -> AsyncIterable[dict[str, Any]]:
-        """Process the query and call Agent A."""
-        # Yield processing message
-        yield {
-            "is_task_complete": False,
-            "updates": self.get_processing_message(),
-        }
-        
+        """Process the query and call Agent A.
+
+        Only the custom form flow streams a progress update; the standard
+        flow yields its single final result directly.
+        """
         # Check if user wants a custom greeting
         if "custom" in query.lower():
+            # Yield processing message
+            yield {
+                "is_task_complete": False,
+                "updates": self.get_processing_message(),
+            }
+            
             # Send a custom greeting request to Agent A
-            agent_a_url = os.getenv("AGENT_A_URL")
-            if not agent_a_url:
+            if not self._process_url:
                 yield {
                     "is_task_complete": True,
                     "content": "Error: AGENT_A_URL is not configured.",
                 }
                 return
                 
-            headers = {"Content-Type": "application/json"}
-            clerk_token = os.getenv("CLERK_TOKEN")
-            if clerk_token:
-                headers["Authorization"] = f"Bearer {clerk_token}"
-                
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    # Request a custom form from Agent A
-                    name = self.extract_name(query)
-                    custom_query = f"custom greeting for {name}" if name else "custom greeting"
-                    
-                    response = await client.post(
-                        f"{agent_a_url}/process",
-                        json={"query": custom_query, "session_id": session_id},
-                        headers=headers,
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        content = f"Demonstrating A2A communication with forms:\n"
-                        if isinstance(result, dict) and result.get("type") == "form":
-                            content += f"Agent A provided a customization form:\n{json.dumps(result, indent=2)}"
-                        else:
-                            content += str(result)
-                        
-                        yield {
-                            "is_task_complete": True,
-                            "content": content,
-                        }
+                # Request a custom form from Agent A
+                name = self.extract_name(query)
+                custom_query = f"custom greeting for {name}" if name else "custom greeting"
+                
+                response = await http_client.post(
+                    self._process_url,
+                    content=orjson.dumps({"query": custom_query, "session_id": session_id}),
+                    headers=self._headers,
+                )
+                
+                if response.status_code == 200:
+                    result = orjson.loads(response.content)
+                    content = f"Demonstrating A2A communication with forms:\n"
+                    if isinstance(result, dict) and result.get("type") == "form":
+                        content += f"Agent A provided a customization form:\n{response.text}"
                     else:
-                        yield {
-                            "is_task_complete": True,
-                            "content": f"Error: HTTP {response.status_code} - {response.text}",
-                        }
+                        content += str(result)
+                    
+                    yield {
+                        "is_task_complete": True,
+                        "content": content,
+                    }
+                else:
+                    yield {
+                        "is_task_complete": True,
+                        "content": f"Error: HTTP {response.status_code} - {response.text}",
+                    }
             except Exception as e:
                 yield {
                     "is_task_complete": True,
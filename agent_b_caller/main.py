@@ -1,6 +1,11 @@
+import asyncio
+import contextlib
+import hashlib
 import logging
 import os
+from typing import AsyncIterator, Optional
 
+import orjson
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
@@ -9,11 +14,12 @@ from a2a.types import (
     AgentCard,
     AgentSkill,
 )
+from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
-from caller_agent import CallerAgent
+from caller_agent import CallerAgent, http_client
 from agent_executor import CallerAgentExecutor
 from dotenv import load_dotenv
 
@@ -33,6 +39,10 @@ secrets_health = {
     "STATUS": "No LLM dependencies - ready for A2A testing",
     "AGENT_A_URL": "OK" if os.getenv("AGENT_A_URL") is not None else "MISSING",
 }
+# Health data only depends on the environment at startup, so serialize it once
+_health_body = orjson.dumps(
+    {"status": "Caller Agent is running.", "secrets_health": secrets_health}
+)
 
 capabilities = AgentCapabilities(streaming=True)
 skill = AgentSkill(
@@ -59,8 +69,17 @@ agent_card = AgentCard(
     capabilities=capabilities,
     skills=[skill],
 )
+AGENT_CARD_PATH = "/.well-known/agent.json"
+
+# The agent card is fixed for the life of the process, so serialize it once
+_agent_card_body = agent_card.model_dump_json(by_alias=True, exclude_none=True).encode()
+_agent_card_headers = {
+    "ETag": f'"{hashlib.blake2b(_agent_card_body, digest_size=8).hexdigest()}"',
+    "Cache-Control": "public, max-age=300",
+}
+caller_executor = CallerAgentExecutor()
 request_handler = DefaultRequestHandler(
-    agent_executor=CallerAgentExecutor(),
+    agent_executor=caller_executor,
     task_store=InMemoryTaskStore(),
 )
 
@@ -71,29 +90,95 @@ server = A2AStarletteApplication(
 )
 
 
-async def _health(request: Request) -> JSONResponse:
+async def _health(request: Request) -> Response:
     """Handles GET requests for the health endpoint.
 
     Args:
         request: The incoming Starlette Request object.
 
     Returns:
-        A JSONResponse containing the application health data.
+        A Response containing the pre-serialized application health data.
+    """
+    return Response(_health_body, media_type="application/json")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Checks an If-None-Match header against the current ETag.
+
+    The header may list several entity tags separated by commas, each
+    optionally weak (``W/`` prefix), or be ``*`` to match any version.
+
+    Args:
+        if_none_match: The raw If-None-Match header value, if any.
+        etag: The current strong ETag, including its quotes.
+
+    Returns:
+        True if the client already holds the current version.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def _agent_card(request: Request) -> Response:
+    """Handles GET requests for the agent card.
+
+    Args:
+        request: The incoming Starlette Request object.
+
+    Returns:
+        A Response with the pre-serialized agent card, or an empty 304 if the
+        client already holds the current version.
     """
-    return JSONResponse(
-        {"status": "Caller Agent is running.", "secrets_health": secrets_health}
+    if_none_match = request.headers.get("if-none-match")
+    if _etag_matches(if_none_match, _agent_card_headers["ETag"]):
+        return Response(status_code=304, headers=_agent_card_headers)
+    return Response(
+        _agent_card_body, media_type="application/json", headers=_agent_card_headers
     )
 
 
+@contextlib.asynccontextmanager
+async def _lifespan(app: Starlette) -> AsyncIterator[None]:
+    """Manages resources shared across requests for the lifetime of the app.
+
+    On startup, warms the pooled HTTP client used to call the Greeter Agent
+    in the background, so the first request does not pay for DNS and
+    connection setup and startup does not wait on the Greeter Agent. On
+    shutdown, closes that client.
+
+    Args:
+        app: The Starlette application being served.
+    """
+    # Keep a reference so the task is not garbage collected while running
+    warm_up = asyncio.create_task(caller_executor.warm_up())
+    yield
+    warm_up.cancel()
+    await http_client.aclose()
+
+
 app = server.build(
+    agent_card_url=AGENT_CARD_PATH,
     routes=[
+        # Registered ahead of the A2A routes so it replaces the default handler
+        Route(
+            AGENT_CARD_PATH,
+            _agent_card,
+            methods=["GET"],
+            name="agent_card",
+        ),
         Route(
             "/health",
             _health,
             methods=["GET"],
             name="health_check",
         )
-    ]
+    ],
+    lifespan=_lifespan,
 )
 
 if __name__ == "__main__":
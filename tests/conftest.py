@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# The agents are run as scripts from their own directories and import their
+# modules as top-level names (e.g. ``from caller_agent import CallerAgent``)
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT / "agent_a_greeter"))
+sys.path.insert(0, str(_ROOT / "agent_b_caller"))
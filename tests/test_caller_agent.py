@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+import caller_agent
+from caller_agent import CallerAgent
+
+
+@pytest.mark.parametrize(
+    "query, name",
+    [
+        # Skill examples from the agent card
+        ("Ask the greeter to say hello to John", "John"),
+        ("Get a greeting for Maria from the other agent", "Maria"),
+        ("Call the greeter agent to welcome Alex", "Alex"),
+        ("custom greeting for Ann", "Ann"),
+        ("greet Bob", "Bob"),
+        # A specific pattern must win over the "call ... last word" fallback
+        ("Call the greeter for John today", "John"),
+        ("Call the greeter to say hello to Bob please", "Bob"),
+        ("Ask the caller to greet Bob please", "Bob"),
+        # Capitalized-word fallback and default
+        ("please wave at Sam", "Sam"),
+        ("hi there", "Someone"),
+    ],
+)
+def test_extract_name(query, name):
+    assert CallerAgent().extract_name(query) == name
+
+
+@pytest.fixture
+def get_calls(monkeypatch):
+    """Record the URLs passed to the shared client's get, then delegate."""
+    calls = []
+    real_get = caller_agent.http_client.get
+
+    async def get(url, **kwargs):
+        calls.append(url)
+        return await real_get(url, **kwargs)
+
+    monkeypatch.setattr(caller_agent.http_client, "get", get)
+    return calls
+
+
+def test_warm_up_connection_ignores_malformed_url(monkeypatch, get_calls):
+    monkeypatch.setenv("AGENT_A_URL", "http://[::1")
+    agent = CallerAgent()
+    asyncio.run(agent.warm_up_connection())
+    assert get_calls == [agent._health_url]
+
+
+def test_warm_up_connection_skips_without_url(monkeypatch, get_calls):
+    monkeypatch.delenv("AGENT_A_URL", raising=False)
+    asyncio.run(CallerAgent().warm_up_connection())
+    assert get_calls == []
@@ -0,0 +1,27 @@
+import re
+
+import pytest
+
+import greeter_agent
+from greeter_agent import greet_simple
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"name": "Ann"},
+        {"name": "Dr. Smith", "style": "formal"},
+        {"name": "Bob", "style": "fun"},
+        {},
+    ],
+)
+def test_greet_simple_has_no_form_placeholders(kwargs):
+    result = greet_simple(**kwargs)
+    assert result["status"] == "delivered"
+    assert not re.search(r"<[^>]*>", result["greeting"])
+
+
+def test_greet_simple_does_not_store_a_form(monkeypatch):
+    monkeypatch.setattr(greeter_agent, "greeting_history", greeter_agent.OrderedDict())
+    greet_simple("Ann")
+    assert not greeter_agent.greeting_history